@@ -7,20 +7,29 @@ Self-contained implementation with slash commands and Pydantic validation
 import discord
 from discord.ext import commands
 import asyncio
+import logging
+import sys
 import json
+import random
 import re
+import time
 from datetime import datetime
 import os
 import warnings
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Dict, Any, Final, Optional, Type
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from langchain.agents import initialize_agent, AgentType, Tool
 from langchain.tools import BaseTool
+from langchain_core.pydantic_v1 import BaseModel as BaseModelV1, Field as FieldV1
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain.schema import HumanMessage
-from pydantic import BaseModel, Field, validator, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, ValidationError
 import requests
 from dotenv import load_dotenv
 
@@ -30,61 +39,245 @@ load_dotenv()
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 
+# Level-gated diagnostics: %-style arguments are only formatted when a
+# record actually passes the level check, so quiet deployments skip the
+# string building that print/f-strings always pay
+logging.basicConfig(format="%(message)s")
+logger = logging.getLogger("pookan")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
 # Discord Bot Configuration
 intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
 
+# Constrained types checked inside pydantic-core's Rust layer - no Python
+# validator callback per field like the old @field_validator methods
+Ticker = Annotated[str, StringConstraints(min_length=1, max_length=5, pattern=r'^[A-Za-z]+$', to_upper=True)]
+Query = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+
 # Pydantic Models for Validation
+# StockTickerInput is the single input model: every tool and the slash
+# handler ultimately validate a ticker plus an optional free-form query
 class StockTickerInput(BaseModel):
     """Validate stock ticker input"""
-    ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
-    query: Optional[str] = Field(None, max_length=500, description="Optional analysis query")
-    
-    @field_validator('ticker')
-    @classmethod
-    def validate_ticker(cls, v):
-        """Validate ticker format"""
-        if not v.isalpha():
-            raise ValueError('Ticker must contain only letters')
-        if len(v) > 5:
-            raise ValueError('Ticker must be 5 characters or less')
-        return v.upper()
-
-class MarketDataInput(BaseModel):
-    """Validate market data tool input"""
-    query: str = Field(..., min_length=1, max_length=200, description="Market data query")
-    
-    @field_validator('query')
-    @classmethod
-    def validate_query(cls, v):
-        """Validate query format"""
-        if not v.strip():
-            raise ValueError('Query cannot be empty')
-        return v.strip()
-
-class AnalysisQueryInput(BaseModel):
-    """Validate analysis query input"""
-    ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
-    focus: Optional[str] = Field(None, max_length=200, description="Analysis focus area")
-    
-    @field_validator('ticker')
-    @classmethod
-    def validate_ticker(cls, v):
-        """Validate ticker format"""
-        if not v.isalpha():
-            raise ValueError('Ticker must contain only letters')
-        return v.upper()
-
-class MarketDataResult(BaseModel):
-    """Validate market data result"""
-    ticker: str
-    price: float = Field(..., gt=0, description="Current stock price")
-    change_percent: float = Field(..., description="Price change percentage")
-    volume: int = Field(..., gt=0, description="Trading volume")
-    rsi: float = Field(..., ge=0, le=100, description="RSI value")
-    sma_20: float = Field(..., gt=0, description="20-day SMA")
-    sma_50: float = Field(..., gt=0, description="50-day SMA")
+    # frozen + extra='forbid' keeps instances small and skips the mutable
+    # bookkeeping pydantic otherwise maintains on every construction
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    ticker: Ticker = Field(..., description="Stock ticker symbol")
+    query: Optional[Query] = Field(None, description="Optional analysis query")
+
+# Validators built once at import time - constructing them is the expensive
+# part of pydantic, and these run several times per /analyze
+_TICKER_ADAPTER = TypeAdapter(StockTickerInput)
+
+# One C-level scan to pull a candidate ticker out of a free-form query
+_TICKER_RE = re.compile(r'\b([A-Za-z]{1,5})\b')
+
+# Field names for the vectorized data-quality gate in MarketDataTool, in
+# the order the metrics are packed
+_METRIC_NAMES = ("price", "volume", "RSI", "20-day SMA", "50-day SMA")
+
+# Parses price/change/volume back out of MarketDataTool's formatted output
+_MARKET_DATA_RE = re.compile(r'([A-Z]+) Market Data: Price=\$([^,]+), Change=([^,]+), Volume=([0-9,]+),')
+
+# One bounded worker pool for every blocking finance/LLM call. A shared pool
+# overlaps independent HTTP fetches while capping thread count under burst
+# load, unlike the per-call threads asyncio.to_thread takes from the
+# interpreter-default executor
+_YF_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="yf")
+
+# One persistent HTTP session for every Yahoo call. yfinance otherwise opens
+# a fresh connection per Ticker, paying the TCP/TLS handshake (~50-150ms)
+# each time instead of reusing the keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "Mozilla/5.0 (compatible; discord-stock-bot/1.0)"
+
+# In-process TTL caches for yfinance data
+# Every /analyze runs four tools and several of them need the same ticker's
+# history and info, so without caching one command triggers 3-4 identical
+# HTTP round trips to Yahoo Finance
+_HIST_TTL = 60    # seconds - intraday prices go stale quickly
+_SPY_TTL = 300    # seconds - the SPY benchmark is hit identically by every risk assessment
+_INFO_TTL = 900   # seconds - fundamentals rarely change intraday
+_CACHE_MAX = 256  # per cache - bounds memory across every ticker ever queried
+_hist_cache: Dict[tuple, tuple] = {}  # (ticker, period) -> (timestamp, DataFrame)
+_info_cache: Dict[str, tuple] = {}    # ticker -> (timestamp, info dict)
+
+def _cache_put(cache: Dict, key, value) -> None:
+    """Store a freshly fetched value, evicting the oldest entry when full
+
+    Expired entries are otherwise only overwritten on a re-fetch of the
+    same key, so without a bound the caches grow for the life of the
+    process as new tickers are queried.
+    """
+    if key not in cache and len(cache) >= _CACHE_MAX:
+        cache.pop(min(cache, key=lambda k: cache[k][0]))
+    cache[key] = (time.time(), value)
+
+def _retry_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """Backoff delay before retrying a failed fetch
+
+    Exponential with a little jitter so concurrent retries don't stampede
+    Yahoo in lockstep; honors Retry-After when the error carries a 429.
+    """
+    if error is not None:
+        response = getattr(error, 'response', None)
+        if response is not None and getattr(response, 'status_code', None) == 429:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+    return min(2 ** attempt * 0.2, 4.0) + random.uniform(0, 0.1)
+
+def get_history(ticker: str, period: str = "60d", ttl: int = _HIST_TTL) -> pd.DataFrame:
+    """Get price history for a ticker, served from memory within the TTL window"""
+    key = (ticker, period)
+    cached = _hist_cache.get(key)
+    if cached is not None and time.time() - cached[0] < ttl:
+        return cached[1]
+    hist = yf.Ticker(ticker, session=_SESSION).history(period=period)
+    if not hist.empty:
+        _cache_put(_hist_cache, key, hist)
+    return hist
+
+def get_info(ticker: str, ttl: int = _INFO_TTL) -> dict:
+    """Get company info for a ticker, served from memory within the TTL window
+
+    The fetch goes through yfinance's .info so its cookie/crumb handling
+    stays in play - Yahoo rejects bare quoteSummary requests - and the
+    TTL cache keeps the payload from being refetched within the window.
+    """
+    cached = _info_cache.get(ticker)
+    if cached is not None and time.time() - cached[0] < ttl:
+        return cached[1]
+    info = yf.Ticker(ticker, session=_SESSION).info
+    if info:
+        _cache_put(_info_cache, ticker, info)
+    return info
+
+def _ewm(x: np.ndarray, span: int) -> np.ndarray:
+    """Exponentially weighted mean of x, matching pandas ewm(span=...)
+
+    Cumulates numerator and denominator in place so the only allocations
+    are the weight buffer and the returned array.
+    """
+    alpha = 2.0 / (span + 1.0)
+    weights = (1.0 - alpha) ** -np.arange(len(x), dtype=np.float64)
+    num = x * weights
+    np.cumsum(num, out=num)
+    np.cumsum(weights, out=weights)
+    num /= weights
+    return num
+
+def _compute_indicators(close: np.ndarray) -> dict:
+    """Compute RSI, SMAs, MACD and Bollinger Bands from raw close prices
+
+    Works on a plain NumPy array and returns only the final scalars,
+    replacing the chains of pandas .diff()/.where()/.rolling()/.ewm() calls
+    that each materialized a full intermediate Series. Indicators without
+    enough data come back as NaN, same as their pandas rolling equivalents.
+    """
+    if len(close) >= 15:
+        # only the last 14 deltas feed the RSI averages, so diff just those
+        delta = np.diff(close[-15:])
+        avg_gain = delta[delta > 0].sum() / 14.0
+        avg_loss = -delta[delta < 0].sum() / 14.0
+        rsi = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    else:
+        rsi = float("nan")
+    sma_20 = close[-20:].mean() if len(close) >= 20 else float("nan")
+    sma_50 = close[-50:].mean() if len(close) >= 50 else float("nan")
+    std_20 = close[-20:].std(ddof=1) if len(close) >= 20 else float("nan")
+    macd_series = _ewm(close, 12)
+    macd_series -= _ewm(close, 26)
+    return {
+        "rsi": rsi,
+        "sma_20": sma_20,
+        "sma_50": sma_50,
+        "macd": macd_series[-1],
+        "macd_signal": _ewm(macd_series, 9)[-1],
+        "bb_upper": sma_20 + 2 * std_20,
+        "bb_lower": sma_20 - 2 * std_20,
+    }
+
+@dataclass
+class TickerContext:
+    """Market data shared by all tools within one /analyze invocation"""
+    hist: pd.DataFrame
+    info: dict
+    spy_hist: pd.DataFrame
+
+def build_ticker_context(ticker: str, period: str = "60d") -> TickerContext:
+    """Download everything one /analyze needs in a single batched request
+
+    Yahoo's chart endpoint accepts multiple symbols per request, so the
+    ticker and the SPY benchmark come back in one round trip. Results are
+    seeded into the TTL caches so any tool the agent invokes afterwards is
+    served from memory instead of re-fetching.
+    """
+    now = time.time()
+    cached = _hist_cache.get((ticker, period))
+    spy_cached = _hist_cache.get(("SPY", period))
+    if (cached is not None and now - cached[0] < _HIST_TTL
+            and spy_cached is not None and now - spy_cached[0] < _SPY_TTL):
+        return TickerContext(hist=cached[1], info=get_info(ticker), spy_hist=spy_cached[1])
+    hist = pd.DataFrame()
+    spy_hist = pd.DataFrame()
+    try:
+        # auto_adjust=True matches Ticker.history's default so batched and
+        # per-ticker fetches seed identical frames into _hist_cache
+        batch = yf.download([ticker, "SPY"], period=period, group_by="ticker",
+                            auto_adjust=True, threads=True, progress=False)
+        if not batch.empty:
+            hist = batch[ticker].dropna(how="all")
+            spy_hist = batch["SPY"].dropna(how="all")
+    except Exception:
+        pass  # fall back to per-ticker fetches below
+    if hist.empty:
+        hist = get_history(ticker, period)
+    else:
+        _cache_put(_hist_cache, (ticker, period), hist)
+    if spy_hist.empty:
+        spy_hist = get_history("SPY", period, ttl=_SPY_TTL)
+    else:
+        _cache_put(_hist_cache, ("SPY", period), spy_hist)
+    info = get_info(ticker)
+    return TickerContext(hist=hist, info=info, spy_hist=spy_hist)
+
+def fetch_history_batch(tickers: list, period: str = "60d") -> Dict[str, pd.DataFrame]:
+    """Download history for several tickers in one HTTP request
+
+    Yahoo's endpoint accepts up to 20 symbols per request, so a future
+    /compare command can analyze a whole portfolio for the cost of a single
+    round trip. Entries still fresh in the TTL cache are reused and newly
+    fetched frames are seeded back into it.
+    """
+    now = time.time()
+    result: Dict[str, pd.DataFrame] = {}
+    missing = []
+    for t in tickers:
+        cached = _hist_cache.get((t, period))
+        if cached is not None and now - cached[0] < _HIST_TTL:
+            result[t] = cached[1]
+        else:
+            missing.append(t)
+    if missing:
+        batch = yf.download(missing, period=period, group_by="ticker",
+                            auto_adjust=True, threads=True, progress=False)
+        for t in missing:
+            try:
+                df = batch[t].dropna(how="all")
+            except Exception:
+                # single-ticker downloads come back without the ticker level
+                df = batch.dropna(how="all") if len(missing) == 1 else pd.DataFrame()
+            result[t] = df
+            if not df.empty:
+                _cache_put(_hist_cache, (t, period), df)
+    return result
 
 # Initialize the LangChain system with fallback mechanism: Anthropic first, OpenAI second
 def configure_langchain():
@@ -94,28 +287,28 @@ def configure_langchain():
     
     if anthropic_key:
         try:
-            print("🔵 Using Anthropic Claude Sonnet as primary LLM")
+            logger.info("🔵 Using Anthropic Claude Sonnet as primary LLM")
             llm = ChatAnthropic(model="claude-sonnet-4-0", anthropic_api_key=anthropic_key)
             return llm, "anthropic"
         except Exception as e:
-            print(f"⚠️ Anthropic configuration failed: {e}")
+            logger.error("⚠️ Anthropic configuration failed: %s", e)
             if openai_key:
                 try:
-                    print("🟢 Falling back to OpenAI GPT-4")
+                    logger.info("🟢 Falling back to OpenAI GPT-4")
                     llm = ChatOpenAI(model="gpt-4", openai_api_key=openai_key)
                     return llm, "openai"
                 except Exception as e2:
-                    print(f"❌ OpenAI fallback also failed: {e2}")
+                    logger.error("❌ OpenAI fallback also failed: %s", e2)
                     raise Exception("Both Anthropic and OpenAI configurations failed")
             else:
                 raise Exception("Anthropic failed and no OpenAI API key available")
     elif openai_key:
         try:
-            print("🟢 Using OpenAI GPT-4 as primary LLM")
+            logger.info("🟢 Using OpenAI GPT-4 as primary LLM")
             llm = ChatOpenAI(model="gpt-4", openai_api_key=openai_key)
             return llm, "openai"
         except Exception as e:
-            print(f"❌ OpenAI configuration failed: {e}")
+            logger.error("❌ OpenAI configuration failed: %s", e)
             raise Exception("OpenAI configuration failed")
     else:
         raise Exception("No API keys found. Please set either ANTHROPIC_API_KEY or OPENAI_API_KEY")
@@ -123,107 +316,115 @@ def configure_langchain():
 # Configure LangChain
 try:
     llm, provider = configure_langchain()
-    print(f"✅ LangChain configured successfully with {provider.upper()}")
+    logger.info("✅ LangChain configured successfully with %s", provider.upper())
 except Exception as e:
-    print(f"❌ LangChain configuration failed: {e}")
-    print("💡 Please check your API keys and try again")
+    logger.error("❌ LangChain configuration failed: %s", e)
+    logger.error("💡 Please check your API keys and try again")
     exit(1)
 
+# The provider never changes after startup, so derive the strings built
+# from it once instead of re-running .upper() and f-string formatting in
+# every handler
+_PROVIDER_UPPER: Final[str] = provider.upper()
+_FRAMEWORK_NAME: Final[str] = "LangChain Single Agent + Pydantic"
+_ANALYSIS_FOOTER: Final[str] = f"pookan-langchain-pydantic • {_PROVIDER_UPPER} • Real-time market data"
+_STATUS_FOOTER_PREFIX: Final[str] = "pookan-langchain-pydantic • "
+
+# Startup banner emitted by main() in a single buffered write
+_STARTUP_TEMPLATE = """🚀 Starting pookan-langchain Discord bot with Pydantic validation...
+📊 Bot will be ready to analyze any stocks!
+✅ Environment variables loaded successfully
+🤖 Provider: {provider}
+🔒 Pydantic validation enabled
+💡 Use /analyze <ticker> to analyze a stock
+💡 Use /help to see comprehensive help
+💡 Use /status to see bot configuration
+"""
+
 # Self-contained LangChain Single Agent Implementation with Pydantic Validation
-class MarketDataTool(BaseTool):
+class _ToolInput(BaseModelV1):
+    """Single-input schema shared by every tool
+
+    langchain's BaseTool still runs on pydantic v1 internally, so the
+    schema is a v1 model. Declaring it explicitly keeps langchain from
+    inferring one off _run's signature, whose out-of-band TickerContext
+    parameter holds DataFrames that JSON Schema cannot describe.
+    """
+    query: str = FieldV1(description="Stock ticker symbol or free-form question")
+
+class StockAnalysisTool(BaseTool):
+    """Shared base for the finance tools
+
+    The sync _run bodies block on yfinance HTTP, so the async entry point
+    hands them to the shared worker pool; agent.ainvoke then never stalls
+    the Discord event loop waiting on a tool.
+    """
+    args_schema: Type[BaseModelV1] = _ToolInput
+
+    async def _arun(self, query: str, context: Optional[TickerContext] = None) -> str:
+        return await asyncio.get_running_loop().run_in_executor(
+            _YF_POOL, self._run, query, context)
+
+class MarketDataTool(StockAnalysisTool):
     name: str = "get_market_data"
     description: str = "Get real-time market data for any stock including price, volume, and technical indicators"
     
-    def _run(self, query: str) -> str:
+    def _run(self, query: str, context: Optional[TickerContext] = None) -> str:
         """Get market data for any stock with Pydantic validation"""
         try:
-            # Validate input with Pydantic
-            validated_input = MarketDataInput(query=query)
-            
-            # Extract ticker from query or use default
-            ticker = "TSLA"  # Default fallback
-            if validated_input.query and len(validated_input.query.strip()) > 0:
-                # Try to extract ticker from query
-                words = validated_input.query.strip().upper().split()
-                for word in words:
-                    if len(word) <= 5 and word.isalpha():
-                        ticker = word
-                        break
-            
-            # Validate ticker with Pydantic
-            validated_ticker = StockTickerInput(ticker=ticker)
-            ticker = validated_ticker.ticker
+            # Extract the ticker with one compiled-regex scan and validate it
+            # in a single Pydantic pass - the raw query needs no model round trip
+            match = _TICKER_RE.search(query or "")
+            ticker = _TICKER_ADAPTER.validate_python(
+                {"ticker": match.group(1) if match else "TSLA"}
+            ).ticker
             
             # Get stock data with timeout and retry
-            import time
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period="60d")
-                    
+                    hist = context.hist if context is not None else get_history(ticker)
+
                     if hist.empty:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)
+                        # retrying cannot help when the caller handed us the
+                        # data - only our own fetches are worth repeating
+                        if context is None and attempt < max_retries - 1:
+                            time.sleep(_retry_delay(attempt))
                             continue
                         return f"Error: Unable to fetch {ticker} market data after multiple attempts"
                     
                     # Calculate current metrics
-                    current_price = hist['Close'].iloc[-1]
-                    previous_close = hist['Close'].iloc[-2]
+                    close = hist['Close'].to_numpy(dtype=np.float64)
+                    current_price = close[-1]
+                    previous_close = close[-2]
                     price_change = ((current_price - previous_close) / previous_close) * 100
                     volume = hist['Volume'].iloc[-1]
-                    
-                    # Calculate technical indicators
-                    delta = hist['Close'].diff()
-                    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                    rs = gain / loss
-                    rsi = 100 - (100 / (1 + rs))
-                    current_rsi = rsi.iloc[-1]
-                    
-                    sma_20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-                    sma_50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-                    
-                    # Handle NaN values and validate data before Pydantic validation
-                    if pd.isna(current_rsi) or pd.isna(sma_20) or pd.isna(sma_50):
+
+                    # Calculate technical indicators in one NumPy pass
+                    indicators = _compute_indicators(close)
+                    current_rsi = indicators['rsi']
+                    sma_20 = indicators['sma_20']
+                    sma_50 = indicators['sma_50']
+                    
+                    # Data-quality gate in one vectorized pass: every metric
+                    # must be finite and positive, with RSI inside [0, 100]
+                    metrics = np.array([current_price, volume, current_rsi, sma_20, sma_50], dtype=np.float64)
+                    if not np.isfinite(metrics).all():
                         return f"Error: Insufficient data for {ticker} - need at least 50 days of trading data"
-                    
-                    if current_price <= 0:
-                        return f"Error: Invalid price data for {ticker} - price must be positive"
-                    
-                    if volume <= 0:
-                        return f"Error: Invalid volume data for {ticker} - volume must be positive"
-                    
-                    if current_rsi < 0 or current_rsi > 100:
-                        return f"Error: Invalid RSI value for {ticker} - RSI must be between 0 and 100"
-                    
-                    if sma_20 <= 0 or sma_50 <= 0:
-                        return f"Error: Invalid moving average data for {ticker} - SMAs must be positive"
-                    
-                    # Validate result with Pydantic
-                    try:
-                        validated_result = MarketDataResult(
-                            ticker=ticker,
-                            price=float(current_price),
-                            change_percent=float(price_change),
-                            volume=int(volume),
-                            rsi=float(current_rsi),
-                            sma_20=float(sma_20),
-                            sma_50=float(sma_50)
-                        )
-                    except ValidationError as e:
-                        print(f"Validation error in market data result: {e}")
-                        return f"Error: Data validation failed for {ticker} - {str(e).split('(')[0]}"
-                    except Exception as e:
-                        print(f"Unexpected error in market data validation: {e}")
-                        return f"Error: Unexpected data processing error for {ticker}"
-                    
+                    valid = metrics > 0
+                    valid[2] = 0 <= current_rsi <= 100
+                    if not valid.all():
+                        field = _METRIC_NAMES[int(np.argmin(valid))]
+                        return f"Error: Invalid {field} data for {ticker}"
+                    
+                    # The explicit checks above already guarantee finite,
+                    # positive metrics with RSI in [0, 100], so no second
+                    # validation pass is needed
                     return f"{ticker} Market Data: Price=${current_price:.2f}, Change={price_change:.2f}%, Volume={volume:,}, RSI={current_rsi:.1f}, 20SMA=${sma_20:.2f}, 50SMA=${sma_50:.2f}"
                     
                 except Exception as e:
                     if attempt < max_retries - 1:
-                        time.sleep(1)
+                        time.sleep(_retry_delay(attempt, e))
                         continue
                     else:
                         raise e
@@ -233,76 +434,48 @@ class MarketDataTool(BaseTool):
         except Exception as e:
             return f"Error fetching market data: {str(e)}"
 
-class TechnicalAnalysisTool(BaseTool):
+class TechnicalAnalysisTool(StockAnalysisTool):
     name: str = "technical_analysis"
     description: str = "Perform technical analysis on any stock using multiple indicators"
     
-    def _run(self, query: str) -> str:
+    def _run(self, query: str, context: Optional[TickerContext] = None) -> str:
         """Perform technical analysis with Pydantic validation"""
         try:
-            # Validate input with Pydantic
-            validated_input = MarketDataInput(query=query)
+            # Extract the ticker with one compiled-regex scan and validate it
+            # in a single Pydantic pass - the raw query needs no model round trip
+            match = _TICKER_RE.search(query or "")
+            ticker = _TICKER_ADAPTER.validate_python(
+                {"ticker": match.group(1) if match else "TSLA"}
+            ).ticker
             
-            # Extract ticker from query or use default
-            ticker = "TSLA"  # Default fallback
-            if validated_input.query and len(validated_input.query.strip()) > 0:
-                # Try to extract ticker from query
-                words = validated_input.query.strip().upper().split()
-                for word in words:
-                    if len(word) <= 5 and word.isalpha():
-                        ticker = word
-                        break
-            
-            # Validate ticker with Pydantic
-            validated_ticker = StockTickerInput(ticker=ticker)
-            ticker = validated_ticker.ticker
-            
-            import time
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period="60d")  # Increased to 60 days for 50-day SMA
-                    
+                    hist = context.hist if context is not None else get_history(ticker)  # 60 days so the 50-day SMA has data
+
                     if hist.empty:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)
+                        # retrying cannot help when the caller handed us the
+                        # data - only our own fetches are worth repeating
+                        if context is None and attempt < max_retries - 1:
+                            time.sleep(_retry_delay(attempt))
                             continue
                         return f"Error: Unable to fetch data for {ticker} technical analysis after multiple attempts"
                     
-                    current_price = hist['Close'].iloc[-1]
-                    
-                    # RSI Analysis
-                    delta = hist['Close'].diff()
-                    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                    rs = gain / loss
-                    rsi = 100 - (100 / (1 + rs))
-                    current_rsi = rsi.iloc[-1]
-                    
-                    # Moving Averages
-                    sma_20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-                    sma_50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-                    
-                    # MACD
-                    ema_12 = hist['Close'].ewm(span=12).mean()
-                    ema_26 = hist['Close'].ewm(span=26).mean()
-                    macd = ema_12 - ema_26
-                    signal = macd.ewm(span=9).mean()
-                    current_macd = macd.iloc[-1]
-                    current_signal = signal.iloc[-1]
-                    
-                    # Bollinger Bands
-                    sma_20_series = hist['Close'].rolling(window=20).mean()
-                    std_20 = hist['Close'].rolling(window=20).std()
-                    upper_band = sma_20_series + (std_20 * 2)
-                    lower_band = sma_20_series - (std_20 * 2)
-                    
+                    # RSI, Moving Averages, MACD and Bollinger Bands in one NumPy pass
+                    close = hist['Close'].to_numpy(dtype=np.float64)
+                    current_price = close[-1]
+                    indicators = _compute_indicators(close)
+                    current_rsi = indicators['rsi']
+                    sma_20 = indicators['sma_20']
+                    sma_50 = indicators['sma_50']
+                    current_macd = indicators['macd']
+                    current_signal = indicators['macd_signal']
+
                     # Analysis
                     rsi_signal = "Overbought" if current_rsi > 70 else "Oversold" if current_rsi < 30 else "Neutral"
                     ma_signal = "Bullish" if current_price > sma_20 > sma_50 else "Bearish" if current_price < sma_20 < sma_50 else "Neutral"
                     macd_signal = "Bullish" if current_macd > current_signal else "Bearish"
-                    bb_position = "Upper Band" if current_price > upper_band.iloc[-1] else "Lower Band" if current_price < lower_band.iloc[-1] else "Middle"
+                    bb_position = "Upper Band" if current_price > indicators['bb_upper'] else "Lower Band" if current_price < indicators['bb_lower'] else "Middle"
                     
                     analysis = f"{ticker} Technical Analysis: RSI={current_rsi:.1f} ({rsi_signal}), MA Signal={ma_signal}, MACD={macd_signal}, Bollinger Band Position={bb_position}"
                     
@@ -310,7 +483,7 @@ class TechnicalAnalysisTool(BaseTool):
                     
                 except Exception as e:
                     if attempt < max_retries - 1:
-                        time.sleep(1)
+                        time.sleep(_retry_delay(attempt, e))
                         continue
                     else:
                         raise e
@@ -320,37 +493,25 @@ class TechnicalAnalysisTool(BaseTool):
         except Exception as e:
             return f"Error in technical analysis: {str(e)}"
 
-class FundamentalAnalysisTool(BaseTool):
+class FundamentalAnalysisTool(StockAnalysisTool):
     name: str = "fundamental_analysis"
     description: str = "Analyze fundamental metrics and company performance for any stock"
     
-    def _run(self, query: str) -> str:
+    def _run(self, query: str, context: Optional[TickerContext] = None) -> str:
         """Perform fundamental analysis with Pydantic validation"""
         try:
-            # Validate input with Pydantic
-            validated_input = MarketDataInput(query=query)
-            
-            # Extract ticker from query or use default
-            ticker = "TSLA"  # Default fallback
-            if validated_input.query and len(validated_input.query.strip()) > 0:
-                # Try to extract ticker from query
-                words = validated_input.query.strip().upper().split()
-                for word in words:
-                    if len(word) <= 5 and word.isalpha():
-                        ticker = word
-                        break
+            # Extract the ticker with one compiled-regex scan and validate it
+            # in a single Pydantic pass - the raw query needs no model round trip
+            match = _TICKER_RE.search(query or "")
+            ticker = _TICKER_ADAPTER.validate_python(
+                {"ticker": match.group(1) if match else "TSLA"}
+            ).ticker
             
-            # Validate ticker with Pydantic
-            validated_ticker = StockTickerInput(ticker=ticker)
-            ticker = validated_ticker.ticker
-            
-            import time
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-                    
+                    info = context.info if context is not None else get_info(ticker)
+
                     # Extract key metrics
                     market_cap = info.get('marketCap', 0)
                     pe_ratio = info.get('trailingPE', 0)
@@ -372,7 +533,7 @@ class FundamentalAnalysisTool(BaseTool):
                     
                 except Exception as e:
                     if attempt < max_retries - 1:
-                        time.sleep(1)
+                        time.sleep(_retry_delay(attempt, e))
                         continue
                     else:
                         raise e
@@ -382,41 +543,37 @@ class FundamentalAnalysisTool(BaseTool):
         except Exception as e:
             return f"Error in fundamental analysis: {str(e)}"
 
-class RiskAssessmentTool(BaseTool):
+class RiskAssessmentTool(StockAnalysisTool):
     name: str = "risk_assessment"
     description: str = "Assess investment risk for any stock based on various factors"
     
-    def _run(self, query: str) -> str:
+    def _run(self, query: str, context: Optional[TickerContext] = None) -> str:
         """Assess investment risk with Pydantic validation"""
         try:
-            # Validate input with Pydantic
-            validated_input = MarketDataInput(query=query)
+            # Extract the ticker with one compiled-regex scan and validate it
+            # in a single Pydantic pass - the raw query needs no model round trip
+            match = _TICKER_RE.search(query or "")
+            ticker = _TICKER_ADAPTER.validate_python(
+                {"ticker": match.group(1) if match else "TSLA"}
+            ).ticker
             
-            # Extract ticker from query or use default
-            ticker = "TSLA"  # Default fallback
-            if validated_input.query and len(validated_input.query.strip()) > 0:
-                # Try to extract ticker from query
-                words = validated_input.query.strip().upper().split()
-                for word in words:
-                    if len(word) <= 5 and word.isalpha():
-                        ticker = word
-                        break
-            
-            # Validate ticker with Pydantic
-            validated_ticker = StockTickerInput(ticker=ticker)
-            ticker = validated_ticker.ticker
-            
-            import time
+            caller_context = context is not None
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period="60d")  # Increased to 60 days for 50-day SMA
-                    info = stock.info
-                    
+                    if context is None:
+                        # One batched download brings back the ticker and the
+                        # SPY benchmark together instead of two serial fetches
+                        context = build_ticker_context(ticker)
+                    hist = context.hist
+                    info = context.info
+
                     if hist.empty:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)
+                        # retrying only helps for contexts we built ourselves;
+                        # drop the empty one so the next attempt refetches
+                        if not caller_context and attempt < max_retries - 1:
+                            context = None
+                            time.sleep(_retry_delay(attempt))
                             continue
                         return f"Error: Unable to fetch {ticker} data for risk assessment after multiple attempts"
                     
@@ -426,8 +583,7 @@ class RiskAssessmentTool(BaseTool):
                     
                     # Beta calculation
                     try:
-                        spy = yf.Ticker("SPY")
-                        spy_hist = spy.history(period="30d")
+                        spy_hist = context.spy_hist
                         if not spy_hist.empty:
                             spy_returns = spy_hist['Close'].pct_change()
                             correlation = returns.corr(spy_returns)
@@ -474,7 +630,7 @@ class RiskAssessmentTool(BaseTool):
                     
                 except Exception as e:
                     if attempt < max_retries - 1:
-                        time.sleep(1)
+                        time.sleep(_retry_delay(attempt, e))
                         continue
                     else:
                         raise e
@@ -494,28 +650,91 @@ tools = [
 
 # Initialize agent
 agent = initialize_agent(
-    tools, 
-    llm, 
+    tools,
+    llm,
     agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
     verbose=True,
     handle_parsing_errors=True
 )
 
+# The LLM round trip dominates /analyze latency and cost, so identical
+# (ticker, focus) commands issued within the TTL window share one answer
+_ANALYSIS_TTL = 300   # seconds
+_ANALYSIS_CACHE_MAX = 256
+_analysis_cache: Dict[tuple, tuple] = {}  # (ticker, focus) -> (timestamp, response)
+
+async def cached_agent_analysis(ticker: str, focus: Optional[str], analysis_query: str) -> str:
+    """Run the agent, deduplicating repeat queries within the TTL window"""
+    key = (ticker, (focus or "").lower().strip())
+    cached = _analysis_cache.get(key)
+    if cached is not None and time.time() - cached[0] < _ANALYSIS_TTL:
+        return cached[1]
+    agent_result = await agent.ainvoke({"input": analysis_query})
+    result = agent_result["output"]
+    if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+        # evict the oldest entry to bound memory
+        _analysis_cache.pop(min(_analysis_cache, key=lambda k: _analysis_cache[k][0]))
+    _analysis_cache[key] = (time.time(), result)
+    return result
+
 @bot.event
 async def on_ready():
     """Bot startup event"""
-    print(f'🤖 {bot.user} has connected to Discord!')
-    print(f'📊 LangChain Stock Bot (Slash Commands) with Pydantic Validation is ready!')
-    print(f'🤖 Provider: {provider.upper()}')
-    print(f'💬 Use /analyze <ticker> to get stock recommendations')
+    logger.info('🤖 %s has connected to Discord!', bot.user)
+    logger.info('📊 LangChain Stock Bot (Slash Commands) with Pydantic Validation is ready!')
+    logger.info('🤖 Provider: %s', _PROVIDER_UPPER)
+    logger.info('💬 Use /analyze <ticker> to get stock recommendations')
     
     # Register slash commands
     try:
-        print("🔄 Registering slash commands...")
+        logger.info("🔄 Registering slash commands...")
         await bot.tree.sync()
-        print("✅ Slash commands registered successfully!")
+        logger.info("✅ Slash commands registered successfully!")
     except Exception as e:
-        print(f"❌ Failed to register slash commands: {e}")
+        logger.error("❌ Failed to register slash commands: %s", e)
+
+def build_analysis_embed(ticker: str, market_data_result: str, result: str) -> discord.Embed:
+    """Build the /analyze response embed in one pass
+
+    Parses price/change/volume out of the market-data string with the
+    precompiled pattern, derives recommendation and confidence from the
+    agent text, and adds every field once - no repeated try/except
+    fallback blocks re-adding the same N/A fields.
+    """
+    match = _MARKET_DATA_RE.search(market_data_result or "")
+    price_str = f"${match.group(2)}" if match else "N/A"
+    change_str = match.group(3) if match else "N/A"
+    volume_str = match.group(4) if match else "N/A"
+
+    # Determine recommendation type and confidence
+    result_lower = result.lower()
+    if "buy" in result_lower:
+        recommendation_type = "BUY"
+        confidence = "High" if "strong" in result_lower or "recommend" in result_lower else "Medium"
+    elif "sell" in result_lower:
+        recommendation_type = "SELL"
+        confidence = "High" if "strong" in result_lower else "Medium"
+    else:
+        recommendation_type = "HOLD"
+        confidence = "Medium"
+
+    embed = discord.Embed(
+        title=f"📊 {ticker} Stock Analysis - LangChain Single Agent (Pydantic)",
+        description="Analysis completed using LangChain single agent system with Pydantic validation",
+        color=0x00ff00
+    )
+    embed.add_field(name="💰 Current Price", value=price_str, inline=True)
+    embed.add_field(name="📈 Change", value=change_str, inline=True)
+    embed.add_field(name="📊 Volume", value=volume_str, inline=True)
+    embed.add_field(name="🎯 Recommendation", value=recommendation_type, inline=True)
+    embed.add_field(name="📊 Confidence", value=confidence, inline=True)
+    embed.add_field(name="⚠️ Risk Level", value="Medium", inline=True)
+    embed.add_field(name="💭 Reasoning", value=result[:1024], inline=False)
+    embed.add_field(name="🔄 Workflow Status", value="Completed with Pydantic Validation", inline=True)
+    embed.add_field(name="⚡ Framework", value=_FRAMEWORK_NAME, inline=True)
+    embed.add_field(name="⏰ Completed", value=datetime.now().strftime("%H:%M:%S"), inline=True)
+    embed.set_footer(text=_ANALYSIS_FOOTER)
+    return embed
 
 # Slash command handlers with Pydantic validation
 @bot.tree.command(name="analyze", description="Analyze any stock using LangChain single agent with Pydantic validation")
@@ -526,7 +745,7 @@ async def analyze_stock_slash(interaction: discord.Interaction, ticker: str, que
     try:
         # Validate input with Pydantic
         try:
-            validated_input = StockTickerInput(ticker=ticker, query=query)
+            validated_input = _TICKER_ADAPTER.validate_python({"ticker": ticker, "query": query})
             ticker = validated_input.ticker
         except ValidationError as e:
             error_embed = discord.Embed(
@@ -546,146 +765,30 @@ async def analyze_stock_slash(interaction: discord.Interaction, ticker: str, que
         embed.add_field(name="Status", value="🔄 Fetching data and analyzing...", inline=False)
         message = await interaction.followup.send(embed=embed)
         
-        # Prepare the analysis query
-        analysis_query = f"Analyze {ticker} stock"
-        if validated_input.query:
-            analysis_query += f" with focus on: {validated_input.query}"
-        
-        # Get market data first using the MarketDataTool
+        # Build the shared market-data context once; the batched download also
+        # warms the TTL caches so the agent's own tool calls skip the network
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(_YF_POOL, build_ticker_context, ticker)
+
+        # Format the market data from the already-downloaded context (no
+        # extra network round trip) and inject it straight into the prompt,
+        # so the agent doesn't burn a ReAct step re-calling get_market_data
+        # for numbers we already have - one fewer LLM round trip per command
         market_tool = MarketDataTool()
-        market_data_result = market_tool.run(ticker)
-        
-        # Get recommendation from agent
-        result = agent.run(analysis_query)
-        
-        # Create detailed response embed
-        embed = discord.Embed(
-            title=f"📊 {ticker} Stock Analysis - LangChain Single Agent (Pydantic)",
-            description="Analysis completed using LangChain single agent system with Pydantic validation",
-            color=0x00ff00
-        )
-        
-        # Add market data - extract from market data result
-        try:
-            print(f"DEBUG - Market data result: {market_data_result}")
-            # Look for market data in the market data result
-            market_data_match = re.search(r'([A-Z]+) Market Data: Price=\$([^,]+), Change=([^,]+), Volume=([0-9,]+),', market_data_result)
-            print(f"DEBUG - Market data match: {market_data_match}")
-            if market_data_match:
-                price_str = market_data_match.group(2)
-                change_str = market_data_match.group(3)
-                volume_str = market_data_match.group(4)
-                print(f"DEBUG - Extracted: price={price_str}, change={change_str}, volume={volume_str}")
-            else:
-                price_str = None
-                change_str = None
-                volume_str = None
-                print("DEBUG - No market data match found")
-            
-            if price_str and change_str and volume_str:
-                embed.add_field(
-                    name="💰 Current Price", 
-                    value=f"${price_str}", 
-                    inline=True
-                )
-                embed.add_field(
-                    name="📈 Change", 
-                    value=change_str, 
-                    inline=True
-                )
-                embed.add_field(
-                    name="📊 Volume", 
-                    value=volume_str, 
-                    inline=True
-                )
-            else:
-                embed.add_field(
-                    name="💰 Current Price", 
-                    value="N/A", 
-                    inline=True
-                )
-                embed.add_field(
-                    name="📈 Change", 
-                    value="N/A", 
-                    inline=True
-                )
-                embed.add_field(
-                    name="📊 Volume", 
-                    value="N/A", 
-                    inline=True
-                )
-        except:
-            embed.add_field(
-                name="💰 Current Price", 
-                value="N/A", 
-                inline=True
-            )
-            embed.add_field(
-                name="📈 Change", 
-                value="N/A", 
-                inline=True
-            )
-            embed.add_field(
-                name="📊 Volume", 
-                value="N/A", 
-                inline=True
-            )
-        
-        # Determine recommendation type and confidence
-        result_lower = result.lower()
-        if "buy" in result_lower:
-            recommendation_type = "BUY"
-            confidence = "High" if "strong" in result_lower or "recommend" in result_lower else "Medium"
-        elif "sell" in result_lower:
-            recommendation_type = "SELL"
-            confidence = "High" if "strong" in result_lower else "Medium"
-        else:
-            recommendation_type = "HOLD"
-            confidence = "Medium"
-        
-        embed.add_field(
-            name="🎯 Recommendation", 
-            value=recommendation_type, 
-            inline=True
-        )
-        embed.add_field(
-            name="📊 Confidence", 
-            value=confidence, 
-            inline=True
-        )
-        embed.add_field(
-            name="⚠️ Risk Level", 
-            value="Medium", 
-            inline=True
-        )
-        
-        # Add reasoning (truncated result)
-        result_short = result[:1024] if len(result) > 1024 else result
-        embed.add_field(
-            name="💭 Reasoning", 
-            value=result_short, 
-            inline=False
-        )
-        
-        # Add workflow status and framework info
-        embed.add_field(
-            name="🔄 Workflow Status", 
-            value="Completed with Pydantic Validation", 
-            inline=True
-        )
-        embed.add_field(
-            name="⚡ Framework", 
-            value="LangChain Single Agent + Pydantic", 
-            inline=True
-        )
-        embed.add_field(
-            name="⏰ Completed", 
-            value=datetime.now().strftime("%H:%M:%S"), 
-            inline=True
+        market_data_result = await loop.run_in_executor(_YF_POOL, market_tool._run, ticker, context)
+
+        analysis_query = (
+            f"Analyze {ticker} stock. "
+            f"Here is the current market data you can use directly: {market_data_result}."
         )
+        if validated_input.query:
+            analysis_query += f" Focus on: {validated_input.query}."
+
+        # ainvoke uses the provider SDK's async transport and the tools'
+        # _arun, so nothing here blocks the Discord event loop
+        result = await cached_agent_analysis(ticker, validated_input.query, analysis_query)
         
-        embed.set_footer(text=f"pookan-langchain-pydantic • {provider.upper()} • Real-time market data")
-        await message.edit(embed=embed)
+        await message.edit(embed=build_analysis_embed(ticker, market_data_result, result))
         
     except Exception as e:
         error_embed = discord.Embed(
@@ -695,157 +798,190 @@ async def analyze_stock_slash(interaction: discord.Interaction, ticker: str, que
         )
         await interaction.followup.send(embed=error_embed)
 
-@bot.tree.command(name="help", description="Show comprehensive help information")
-async def help_command_slash(interaction: discord.Interaction):
-    """Slash command handler for help information"""
-    embed = discord.Embed(
-        title="🤖 LangChain Stock Analysis Bot - Help Guide (Pydantic)",
-        description="**AI-powered stock analysis using LangChain single agent with Pydantic validation**\n\nThis bot provides comprehensive stock analysis with AI recommendations using the latest market data and robust input validation.",
-        color=0x0099ff
-    )
-    
-    # Basic commands
-    embed.add_field(
-        name="📊 **Basic Commands**",
-        value="""
+# Static /help field bodies hoisted to module scope; the embed builder
+# passes them by reference instead of re-binding the literals per build
+_HELP_BASIC: Final[str] = """
 `/analyze <ticker>` - Analyze any stock (e.g., `/analyze MSFT`)
 `/analyze <ticker> <query>` - Specific analysis with custom query
 `/help` - Show this help message
 `/status` - Show bot status and configuration
-        """,
-        inline=False
-    )
-    
-    # Examples
-    embed.add_field(
-        name="💡 **Usage Examples**",
-        value="""
+"""
+
+_HELP_EXAMPLES: Final[str] = """
 • `/analyze AAPL` - Analyze Apple stock
 • `/analyze TSLA should I buy?` - Specific buying advice
 • `/analyze GOOGL analyze fundamentals` - Focus on fundamentals
 • `/analyze NVDA technical analysis` - Focus on technical indicators
-        """,
-        inline=False
-    )
-    
-    # Features
-    embed.add_field(
-        name="🎯 **What You Get**",
-        value="""
+"""
+
+_HELP_FEATURES: Final[str] = """
 • **Real-time market data** from Yahoo Finance
 • **Technical analysis** (RSI, MACD, Moving Averages)
 • **Fundamental analysis** (P/E ratios, debt levels, margins)
 • **Risk assessment** (volatility, beta, risk factors)
 • **Comprehensive recommendations** with detailed reasoning
 • **Pydantic validation** for robust error handling
-        """,
-        inline=False
-    )
-    
-    # Framework info
-    embed.add_field(
-        name="⚡ **LangChain Single Agent + Pydantic**",
-        value="""
+"""
+
+_HELP_FRAMEWORK: Final[str] = """
 • **Unified reasoning** - One agent handles all analysis types
 • **Tool integration** - Seamless access to market data tools
 • **Balanced approach** - Good balance of speed and detail
 • **Reliable performance** - Consistent analysis quality
 • **Input validation** - Pydantic ensures data integrity
 • **Error handling** - Graceful handling of invalid inputs
-        """,
-        inline=False
-    )
-    
-    # Tips
-    embed.add_field(
-        name="💭 **Pro Tips**",
-        value="""
+"""
+
+_HELP_TIPS: Final[str] = """
 • Use any valid stock ticker (e.g., MSFT, AAPL, TSLA)
 • Add specific queries for targeted analysis
 • This bot provides balanced analysis depth
 • Response times are moderate but reliable
 • Great for general stock analysis needs
 • Pydantic validation prevents malformed data
-        """,
-        inline=False
-    )
-    
-    embed.set_footer(text=f"LangChain Single Agent + Pydantic • {provider.upper()} • Real-time market data")
-    await interaction.response.send_message(embed=embed)
+"""
+
+@lru_cache(maxsize=8)
+def _build_help_embed(provider_upper: str) -> discord.Embed:
+    """Build the /help embed from one payload dict in a single pass
+
+    Embed.from_dict ingests the whole payload at once instead of paying a
+    method call and validation pass per add_field. Memoized per provider
+    so a future provider switch still costs one construction; callers
+    share the cached instance and must not mutate it.
+    """
+    return discord.Embed.from_dict({
+        "title": "🤖 LangChain Stock Analysis Bot - Help Guide (Pydantic)",
+        "description": (
+            "**AI-powered stock analysis using LangChain single agent with Pydantic validation**"
+            "\n\nThis bot provides comprehensive stock analysis with AI recommendations "
+            "using the latest market data and robust input validation."
+        ),
+        "color": 0x0099ff,
+        "fields": [
+            {"name": "📊 **Basic Commands**", "value": _HELP_BASIC, "inline": False},
+            {"name": "💡 **Usage Examples**", "value": _HELP_EXAMPLES, "inline": False},
+            {"name": "🎯 **What You Get**", "value": _HELP_FEATURES, "inline": False},
+            {"name": f"⚡ **{_FRAMEWORK_NAME}**", "value": _HELP_FRAMEWORK, "inline": False},
+            {"name": "💭 **Pro Tips**", "value": _HELP_TIPS, "inline": False},
+        ],
+        "footer": {"text": f"{_FRAMEWORK_NAME} • {provider_upper} • Real-time market data"},
+    })
+
+@lru_cache(maxsize=2)
+def _fmt_ts(epoch_second: int) -> str:
+    """Format a wall-clock second for the /status footer
+
+    strftime goes through locale-aware C formatting; caching at one-second
+    granularity lets concurrent /status bursts reuse the same string.
+    """
+    return datetime.fromtimestamp(epoch_second).strftime('%Y-%m-%d %H:%M:%S')
+
+def _build_status_embed(provider_name: str) -> discord.Embed:
+    """Build the /status embed minus the footer - only the timestamp varies"""
+    return discord.Embed.from_dict({
+        "title": "🤖 pookan-langchain Status (Pydantic)",
+        "description": "Bot is running and ready for stock analysis with Pydantic validation",
+        "color": 0x00ff00,
+        "fields": [
+            {"name": "✅ Status", "value": "Online and Ready", "inline": True},
+            {"name": "⚡ Framework", "value": _FRAMEWORK_NAME, "inline": True},
+            {"name": "🎯 Capability", "value": "Stock Analysis (Any Ticker)", "inline": True},
+            {"name": "🤖 Provider", "value": provider_name, "inline": True},
+            {"name": "🔒 Validation", "value": "Pydantic Enabled", "inline": True},
+            {"name": "💡 Commands", "value": "/analyze, /help, /status", "inline": True},
+        ],
+    })
+
+class _CachedEmbed(discord.Embed):
+    """Embed whose to_dict output is computed once
+
+    discord.py re-serializes an embed (walking every field and re-escaping
+    strings) on every send_message; /help's payload never changes, so the
+    dict from the first walk is cached and returned thereafter. Only safe
+    for embeds that are never mutated after construction.
+    """
+    __slots__ = ('_cached_dict',)
+
+    def to_dict(self):
+        cached = getattr(self, '_cached_dict', None)
+        if cached is None:
+            cached = super().to_dict()
+            self._cached_dict = cached
+        return cached
+
+# Both embeds are static once the provider is resolved, so build them a
+# single time at import instead of re-running the add_field chain per request
+_HELP_EMBED = _CachedEmbed.from_dict(_build_help_embed(_PROVIDER_UPPER).to_dict())
+_HELP_EMBED.to_dict()  # warm the serialization cache before the first request
+_STATUS_EMBED_TEMPLATE = _build_status_embed(_PROVIDER_UPPER)
+
+# Frozen keyword payloads for the static handlers - send_message is called
+# by unpacking these, so no per-invocation kwargs dict is allocated
+_HELP_MESSAGE_KWARGS = {"embed": _HELP_EMBED}
+
+@bot.tree.command(name="help", description="Show comprehensive help information")
+async def help_command_slash(interaction: discord.Interaction):
+    """Slash command handler for help information"""
+    await interaction.response.send_message(**_HELP_MESSAGE_KWARGS)
 
 @bot.tree.command(name="status", description="Show bot status and configuration")
 async def status_command_slash(interaction: discord.Interaction):
     """Slash command handler for status"""
-    embed = discord.Embed(
-        title="🤖 pookan-langchain Status (Pydantic)",
-        description="Bot is running and ready for stock analysis with Pydantic validation",
-        color=0x00ff00
-    )
-    
-    embed.add_field(
-        name="✅ Status",
-        value="Online and Ready",
-        inline=True
-    )
-    
-    embed.add_field(
-        name="⚡ Framework",
-        value="LangChain Single Agent + Pydantic",
-        inline=True
-    )
-    
-    embed.add_field(
-        name="🎯 Capability",
-        value="Stock Analysis (Any Ticker)",
-        inline=True
-    )
-    
-    embed.add_field(
-        name="🤖 Provider",
-        value=provider.upper(),
-        inline=True
-    )
-    
-    embed.add_field(
-        name="🔒 Validation",
-        value="Pydantic Enabled",
-        inline=True
-    )
-    
-    embed.add_field(
-        name="💡 Commands",
-        value="/analyze, /help, /status",
-        inline=True
-    )
-    
-    embed.set_footer(text=f"pookan-langchain-pydantic • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    await interaction.response.send_message(embed=embed)
+    # copy the prebuilt template and stamp only the footer timestamp;
+    # ephemeral because status is only interesting to whoever asked
+    embed = _STATUS_EMBED_TEMPLATE.copy()
+    embed.set_footer(text=_STATUS_FOOTER_PREFIX + _fmt_ts(int(time.time())))
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# Environment variables reported by main()'s failed-startup diagnostic
+_ENV_KEYS = ("DISCORD_TOKEN", "ANTHROPIC_API_KEY", "OPENAI_API_KEY")
 
 def main():
     """Run the Discord bot"""
-    token = os.getenv("DISCORD_TOKEN")
+    # run the whole bot on uvloop's libuv event loop where available
+    # (Linux/macOS); the selector default remains the fallback
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # discord.py serializes every gateway/REST payload with stdlib json
+    # unless orjson is importable; point its hooks at orjson explicitly so
+    # embed sends don't silently fall back when auto-detection changes
+    try:
+        import orjson
+        discord.utils._to_json = lambda obj: orjson.dumps(obj).decode('utf-8')
+        discord.utils._from_json = orjson.loads
+    except ImportError:
+        pass
+
+    # look each key up once; the diagnostic block only runs on failure
+    env = os.environ
+    token = env.get("DISCORD_TOKEN")
     if not token:
-        print("❌ Error: DISCORD_TOKEN not found in environment variables")
-        print("💡 Make sure DISCORD_TOKEN is set in environment variables")
-        print("💡 Current environment variables:")
-        print(f"   - DISCORD_TOKEN: {'Set' if os.getenv('DISCORD_TOKEN') else 'Not set'}")
-        print(f"   - ANTHROPIC_API_KEY: {'Set' if os.getenv('ANTHROPIC_API_KEY') else 'Not set'}")
-        print(f"   - OPENAI_API_KEY: {'Set' if os.getenv('OPENAI_API_KEY') else 'Not set'}")
+        logger.error("❌ Error: DISCORD_TOKEN not found in environment variables")
+        logger.error("💡 Make sure DISCORD_TOKEN is set in environment variables")
+        # one comprehension over the key tuple and one joined record; each
+        # 'k in env' is a single dict membership check, and the sweep only
+        # runs at all when error output will actually be emitted
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("\n".join(
+                ["💡 Current environment variables:"]
+                + [f"   - {k}: {'Set' if k in env else 'Not set'}" for k in _ENV_KEYS]
+            ))
         return
     
-    print("🚀 Starting pookan-langchain Discord bot with Pydantic validation...")
-    print("📊 Bot will be ready to analyze any stocks!")
-    print(f"✅ Environment variables loaded successfully")
-    print(f"🤖 Provider: {provider.upper()}")
-    print(f"🔒 Pydantic validation enabled")
-    print(f"💡 Use /analyze <ticker> to analyze a stock")
-    print(f"💡 Use /help to see comprehensive help")
-    print(f"💡 Use /status to see bot configuration")
+    # one buffered write instead of eight print calls, each of which
+    # acquires the stdout lock and may flush on line-buffered terminals
+    sys.stdout.write(_STARTUP_TEMPLATE.format(provider=_PROVIDER_UPPER))
+    sys.stdout.flush()
     
     try:
         bot.run(token)
     except Exception as e:
-        print(f"❌ Failed to start bot: {e}")
+        logger.error("❌ Failed to start bot: %s", e)
 
 if __name__ == "__main__":
     main()